@@ -47,7 +47,7 @@ __copyright__ = 'Copyright 2016 Martin Roberge and contributors'
 from .exceptions import HydroNoDataError
 from .hydrofunctions import (
         get_nwis, extract_nwis_df, nwis_custom_status_codes,
-        get_nwis_property
+        get_nwis_property, enable_cache
         )
 from .station import Station, NWIS
 from .typing import (
@@ -9,6 +9,7 @@ Charting functions for Hydrofunctions.
 # Basically, matplotlib usually uses an 'X11 connection' by default; Travis CI
 # does not have this configured, so you need to set your backend explicitly.
 from __future__ import absolute_import, print_function
+import logging
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -16,6 +17,9 @@ from matplotlib.ticker import NullFormatter
 import numpy as np
 
 
+logger = logging.getLogger(__name__)
+
+
 def flow_duration(Qdf, xscale='logit', yscale='log', ylabel='Stream Discharge (m³/s)', symbol='.'):
     """Creates a flow duration chart from a dataframe of discharges.
 
@@ -172,7 +176,8 @@ def cycleplot(DF, cycle='diurnal', compare=None):
         aggregateby = DF.index.hour
         x_label = ' (hour of the day)'
     else:
-        print("The cycle label '", cycle, "' is not recognized as an option. Using cycle='diurnal' instead.")
+        logger.warning("The cycle label '%s' is not recognized as an option. "
+                       "Using cycle='diurnal' instead.", cycle)
         aggregateby = DF.index.hour
         x_label = ' (hour of the day)'
 
@@ -198,7 +203,8 @@ def cycleplot(DF, cycle='diurnal', compare=None):
         compareby = np.where((DF.index.hour >= 6) & (DF.index.hour < 19), 'Day', 'Night')
         sub_titles = ['Day', 'Night']
     else:
-        print("The compare label '", compare, "' is not recognized as an option. Using compare=None instead.")
+        logger.warning("The compare label '%s' is not recognized as an option. "
+                       "Using compare=None instead.", compare)
         compareby = np.where(DF.index.weekday < 20, 'A', 'B')
         sub_titles = ['data']
 
@@ -9,7 +9,6 @@ Created on Sun Feb 25 19:51:58 2018
 @author: Marty
 """
 from __future__ import absolute_import, print_function
-from IPython.core.display import HTML
 
 
 def draw_map(width=700, height=400, url="http://hydrocloud.org"):
@@ -46,6 +45,8 @@ def draw_map(width=700, height=400, url="http://hydrocloud.org"):
         tool.
 
 """
+    # Import here so that 'import hydrofunctions' does not load IPython.
+    from IPython.core.display import HTML
 
     output = HTML('<p>Use <a href="http://hydrocloud.org" target="_blank">'
                   'HydroCloud.org</a> to find a stream gauge. '
@@ -5,7 +5,11 @@ hydrofunctions.py
 This module contains the main functions used in an interactive session.
 """
 from __future__ import absolute_import, print_function
+import logging
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import pandas as pd
 # Change to relative import: from . import exceptions
@@ -15,6 +19,87 @@ import warnings
 from . import typing
 
 
+logger = logging.getLogger(__name__)
+
+
+def _make_session(session=None):
+    """Create a requests Session for talking to the NWIS.
+
+    A single Session keeps its connections alive between calls, so a loop
+    that requests one site after another only pays for the TCP handshake
+    once. Requests that fail with a 502, 503, or 504 are retried a few times
+    before the last response is handed back to get_nwis().
+
+    Args:
+        session (requests.Session):
+            an existing session to configure, such as a caching session.
+            Default is None, which creates a new requests.Session.
+    """
+    if session is None:
+        session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_maxsize=16, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
+def enable_cache(path='~/.hydrofunctions_cache', ttl=86400):
+    """Save NWIS responses to disk and re-use them for repeated requests.
+
+    Running the same notebook cell over and over will request the same data
+    from the NWIS each time. With the cache enabled, a request for a URL
+    that was already fetched is answered from disk until it expires. This
+    is faster for you and puts less load on the NWIS.
+
+    The cache is off by default. It requires the requests-cache package.
+
+    Args:
+        path (str):
+            the location of the cache file. Default is
+            '~/.hydrofunctions_cache'. Set to None to turn the cache off
+            again.
+
+        ttl (int):
+            the number of seconds to keep a response before requesting it
+            again. Default is 86400 (one day).
+
+    Raises:
+        ImportError: when requests-cache is not installed.
+
+    Example::
+
+        >>> import hydrofunctions as hf
+        >>> hf.enable_cache()
+        >>> response = hf.get_nwis('01585200', 'dv', '2012-06-01', '2012-07-01')
+
+        Turn the cache off:
+
+        >>> hf.enable_cache(None)
+    """
+    global _SESSION
+    if path is None:
+        _SESSION = _make_session()
+        return
+
+    try:
+        import requests_cache
+    except ImportError:
+        raise ImportError("enable_cache() requires the requests-cache "
+                          "package. Install it with "
+                          "'pip install requests-cache'.")
+
+    cached = requests_cache.CachedSession(os.path.expanduser(path),
+                                          expire_after=ttl,
+                                          allowable_methods=('GET',))
+    _SESSION = _make_session(cached)
+
+
 def get_nwis(site, service, start_date=None, end_date=None, stateCd=None,
              countyCd=None, bBox=None, parameterCd='00060', period=None):
     """Request stream gauge data from the USGS NWIS.
@@ -23,6 +108,8 @@ def get_nwis(site, service, start_date=None, end_date=None, stateCd=None,
         site (str or list of strings):
             a valid site is '01585200' or ['01585200', '01646502']. site
             should be None if stateCd or countyCd are not None.
+                * Pass a list instead of calling get_nwis() once per site;
+                  the NWIS returns every site in a single response.
 
         service (str):
             can either be 'iv' or 'dv' for instantaneous or daily data.
@@ -152,10 +239,16 @@ def get_nwis(site, service, start_date=None, end_date=None, stateCd=None,
 
     url = 'http://waterservices.usgs.gov/nwis/'
     url = url + service + '/?'
-    response = requests.get(url, params=values, headers=header)
+    response = _SESSION.get(url, params=values, headers=header)
     # requests will raise a 'ConnectionError' if the connection is refused
     # or if we are disconnected from the internet.
 
+    # We ask for gzip in the header; the NWIS compresses the json by 5-10x,
+    # but only if it honors the request. Log what we got so that a server
+    # that stops compressing is easy to spot.
+    logger.debug("NWIS response Content-Encoding: %s",
+                 response.headers.get('Content-Encoding'))
+
     # .get_nwis() will always return the response.
 
     # Higher-level code that calls get_nwis() may decide to handle or
@@ -433,9 +526,13 @@ def nwis_custom_status_codes(response):
         return None
     # All other status codes will raise a warning.
     else:
-        # Use the status_code as a key, return None if key not in dict
+        # Use the status_code as a key; codes that the NWIS does not
+        # document (502, 504, etc.) still get a warning instead of a
+        # TypeError from adding None to a string.
         msg = "The NWIS returned a code of {}.\n".format(response.status_code) \
-              + nwis_msg.get(str(response.status_code)) \
+              + nwis_msg.get(str(response.status_code),
+                             "Error message from NWIS: {}"
+                             .format(response.reason)) \
               + "\n\nURL used in this request: {}".format(response.url)
 
         # Warnings will not beak the flow. They just print a message.
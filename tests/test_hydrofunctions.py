@@ -12,6 +12,7 @@ from unittest import mock
 import unittest
 
 import pandas as pd
+import requests
 
 import hydrofunctions as hf
 from .test_data import JSON15min2month as test_json
@@ -23,6 +24,7 @@ class fakeResponse(object):
         self.status_code = code
         self.url = "fake url"
         self.reason = "fake reason"
+        self.headers = {'Content-Encoding': 'gzip'}
         # .json will return a function
         # .json() will return test_json
         self.json = lambda: test_json
@@ -37,7 +39,7 @@ class fakeResponse(object):
 
 class TestHydrofunctions(unittest.TestCase):
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_hf_get_nwis_calls_correct_url(self, mock_get):
 
         """
@@ -67,7 +69,7 @@ class TestHydrofunctions(unittest.TestCase):
                                          headers=expected_headers)
         self.assertEqual(actual, expected)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_hf_get_nwis_calls_correct_url_multiple_sites(self, mock_get):
 
         site = ['site1', 'site2']
@@ -93,6 +95,20 @@ class TestHydrofunctions(unittest.TestCase):
                                          headers=expected_headers)
         self.assertEqual(actual, expected)
 
+    def test_hf_session_retries_server_errors(self):
+        adapter = hf.hydrofunctions._SESSION.get_adapter('http://waterservices.usgs.gov/')
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_hf_enable_cache_None_restores_plain_session(self):
+        hf.enable_cache(None)
+        self.assertIs(type(hf.hydrofunctions._SESSION), requests.Session)
+
+    @mock.patch.dict('sys.modules', {'requests_cache': None})
+    def test_hf_enable_cache_raises_ImportError_without_requests_cache(self):
+        with self.assertRaises(ImportError):
+            hf.enable_cache()
+
     def test_hf_extract_nwis_df(self):
         # TODO: I need to check this was parsed correctly!
         actual = hf.extract_nwis_df(test_json)
@@ -158,6 +174,16 @@ class TestHydrofunctions(unittest.TestCase):
         # Does the function return the bad status_code?
         self.assertEqual(actual, expected)
 
+    def test_hf_nwis_custom_status_codes_warns_for_undocumented_code(self):
+        bad_response = fakeResponse()
+        bad_response.status_code = 502
+        bad_response.reason = "Bad Gateway"
+        bad_response.url = "any text"
+        with self.assertWarns(SyntaxWarning) as cm:
+            actual = hf.nwis_custom_status_codes(bad_response)
+        self.assertEqual(actual, 502)
+        self.assertIn("Bad Gateway", str(cm.warning))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -21,6 +21,7 @@ class fakeResponse(object):
         self.status_code = code
         self.url = "fake url"
         self.reason = "fake reason"
+        self.headers = {'Content-Encoding': 'gzip'}
         self.json = lambda: {'data': 'fake json'}
         if code == 200:
             self.ok = True
@@ -167,7 +168,7 @@ class TestNWIS(unittest.TestCase):
                                               period=None, stateCd=None,
                                               countyCd=None, bBox=None)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     @mock.patch("hydrofunctions.hydrofunctions.get_nwis_property")
     def test_hf_get_nwis_accepts_countyCd_array(self, mock_get_prop, mock_get):
         start = "2017-01-01"